@@ -1,13 +1,94 @@
 # payment_domain/__init__.py
-from .models.merchant import Merchant
-from .models.payment import Payment, PaymentStatus
-from .models.refund import CancellationReason, Refund, RefundStatus
+#
+# Models are imported lazily (PEP 562) so that importing the package does not
+# pay for pydantic schema building until a model is actually used.
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from pydantic import TypeAdapter
+
+    from .models.merchant import Merchant
+    from .models.payment import PAYMENT_STATUS_BY_NAME, Payment, PaymentStatus
+    from .models.refund import (
+        CANCELLATION_REASON_BY_NAME,
+        REFUND_STATUS_BY_NAME,
+        CancellationReason,
+        Refund,
+        RefundStatus,
+    )
+
+    # Validate whole batches in a single call, e.g. rows from a database cursor
+    # with PaymentListAdapter.validate_python(rows) or an HTTP payload with
+    # PaymentListAdapter.validate_json(body).
+    PaymentListAdapter: TypeAdapter[List[Payment]]
+    RefundListAdapter: TypeAdapter[List[Refund]]
+
+_LAZY_ATTRIBUTES = {
+    "Merchant": ".models.merchant",
+    "Payment": ".models.payment",
+    "PaymentStatus": ".models.payment",
+    "PAYMENT_STATUS_BY_NAME": ".models.payment",
+    "Refund": ".models.refund",
+    "RefundStatus": ".models.refund",
+    "REFUND_STATUS_BY_NAME": ".models.refund",
+    "CancellationReason": ".models.refund",
+    "CANCELLATION_REASON_BY_NAME": ".models.refund",
+}
 
 __all__ = [
     "Payment",
     "PaymentStatus",
+    "PaymentListAdapter",
+    "PAYMENT_STATUS_BY_NAME",
     "Refund",
     "RefundStatus",
+    "RefundListAdapter",
+    "REFUND_STATUS_BY_NAME",
     "CancellationReason",
+    "CANCELLATION_REASON_BY_NAME",
     "Merchant",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import public names on first access and cache them in the module namespace.
+
+    Args:
+        name (str): The attribute being looked up.
+
+    Returns:
+        Any: The requested model, enum, lookup map or list adapter.
+
+    Raises:
+        AttributeError: If the name is not exported by the package.
+    """
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    elif name == "PaymentListAdapter":
+        from pydantic import TypeAdapter
+
+        from .models.payment import Payment
+
+        value = TypeAdapter(List[Payment])
+    elif name == "RefundListAdapter":
+        from pydantic import TypeAdapter
+
+        from .models.refund import Refund
+
+        value = TypeAdapter(List[Refund])
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """
+    List the module attributes, including exports that are not loaded yet.
+
+    Returns:
+        List[str]: The sorted attribute names.
+    """
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,69 @@
+import os
+import threading
+import time
+
+# KSUID layout, as implemented by ksuid.Ksuid. The ksuid package itself is not
+# imported here so that loading the models does not pull it in.
+_EPOCH_STAMP = 1400000000
+_PAYLOAD_LENGTH_IN_BYTES = 16
+_BASE62_LENGTH = 27
+_BASE62_ALPHABET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+
+# Number of KSUID payloads drawn from the OS random source in a single call.
+_POOL_SIZE = 256
+
+_pool = b""
+_pool_offset = 0
+_pool_lock = threading.Lock()
+
+
+def _reset_pool() -> None:
+    """
+    Discard any buffered random bytes, so a forked child never reuses the
+    payloads already handed out by its parent.
+    """
+    global _pool, _pool_offset, _pool_lock
+    _pool = b""
+    _pool_offset = 0
+    _pool_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):  # Not available on Windows
+    os.register_at_fork(after_in_child=_reset_pool)
+
+
+def _next_payload() -> bytes:
+    """
+    Take the next KSUID payload from the pool, refilling it when exhausted.
+
+    Returns:
+        bytes: A fresh random payload.
+    """
+    global _pool, _pool_offset
+    with _pool_lock:
+        if _pool_offset >= len(_pool):
+            _pool = os.urandom(_PAYLOAD_LENGTH_IN_BYTES * _POOL_SIZE)
+            _pool_offset = 0
+        start = _pool_offset
+        _pool_offset = start + _PAYLOAD_LENGTH_IN_BYTES
+        return _pool[start : start + _PAYLOAD_LENGTH_IN_BYTES]
+
+
+def new_id() -> str:
+    """
+    Generate a new KSUID string.
+
+    The result has the same layout and base62 encoding as ``str(Ksuid())``, but
+    the random payload is taken from a pool filled by one ``os.urandom`` call
+    every few hundred identifiers.
+
+    Returns:
+        str: The base62 encoded KSUID.
+    """
+    value = (int(time.time()) - _EPOCH_STAMP) << (8 * _PAYLOAD_LENGTH_IN_BYTES)
+    value |= int.from_bytes(_next_payload(), "big")
+    chars = []
+    for _ in range(_BASE62_LENGTH):
+        value, digit = divmod(value, 62)
+        chars.append(_BASE62_ALPHABET[digit])
+    return "".join(reversed(chars))
@@ -1,10 +1,21 @@
-from pydantic import BaseModel, Field
+from typing import Union
 
+from pydantic import ConfigDict, Field, TypeAdapter
+from pydantic.dataclasses import dataclass
 
-class Merchant(BaseModel):
+
+@dataclass(
+    config=ConfigDict(extra="ignore", validate_assignment=False),
+    kw_only=True,
+    slots=True,
+)
+class Merchant:
     """
     Represents a merchant with its unique identifier, name, FUC, and terminal.
 
+    Merchant is a slotted Pydantic dataclass rather than a BaseModel, as it is a
+    plain value object that is often held in large caches.
+
     Attributes:
         id (str): Unique identifier for the merchant.
         name (str): Name of the merchant.
@@ -14,9 +25,35 @@ class Merchant(BaseModel):
 
     id: str = Field(default="", description="Merchant unique identifier.")
     name: str = Field(default="", description="Merchant name.")
+    # The digit checks are plain ASCII character classes, so pydantic-core runs
+    # them natively without calling back into Python.
     fuc: str = Field(
-        ..., description="The commerce code of the store.", pattern=r"^\d{1,9}$"
+        ..., description="The commerce code of the store.", pattern=r"^[0-9]{1,9}$"
     )
     terminal: str = Field(
-        ..., description="The terminal number of the merchant.", pattern=r"^\d{1,3}$"
+        ...,
+        description="The terminal number of the merchant.",
+        pattern=r"^[0-9]{1,3}$",
     )
+
+    @classmethod
+    def from_json(cls, data: Union[str, bytes]) -> "Merchant":
+        """
+        Create a Merchant from its JSON representation.
+
+        This is the preferred way to deserialize a merchant: the JSON is parsed
+        and validated in a single pass, without building an intermediate dict.
+
+        Args:
+            data (Union[str, bytes]): The JSON document.
+
+        Returns:
+            Merchant: The validated Merchant instance.
+
+        Raises:
+            ValidationError: If the JSON is malformed or does not match the model.
+        """
+        return _MERCHANT_ADAPTER.validate_json(data)
+
+
+_MERCHANT_ADAPTER: TypeAdapter[Merchant] = TypeAdapter(Merchant)
@@ -1,14 +1,15 @@
-from datetime import datetime, timezone
-from enum import Enum
-from typing import Dict, Optional, Union
+import sys
+import time
+from enum import StrEnum
+from typing import Any, Callable, Dict, Mapping, Optional, Union
 
-from ksuid import Ksuid
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from ..models.refund import CancellationReason
+from ._ids import new_id
 
 
-class PaymentStatus(Enum):
+class PaymentStatus(StrEnum):
     """
     Enum that represents the different payment statuses.
     """
@@ -36,18 +37,15 @@ class PaymentStatus(Enum):
             ValueError: If the name does not match any valid payment status.
         """
         try:
-            return cls[name.upper()]  # Ensure case insensitivity
+            return PAYMENT_STATUS_BY_NAME[name.lower()]  # Case insensitive
         except KeyError:
             raise ValueError(f"Invalid payment status name: {name}")
 
-    def __str__(self):
-        """
-        Return the string representation of the PaymentStatus enum.
 
-        Returns:
-            str: The value of the enum.
-        """
-        return str(self.value)
+# Lowercase member name -> member, for direct lookups by pre-lowered names.
+PAYMENT_STATUS_BY_NAME: Dict[str, PaymentStatus] = {
+    member.name.lower(): member for member in PaymentStatus
+}
 
 
 class Payment(BaseModel):
@@ -65,7 +63,7 @@ class Payment(BaseModel):
         status (PaymentStatus): Status of the payment.
         canceled_at (Optional[int]): Timestamp of when the payment was canceled, in seconds since Unix epoch.
         cancellation_reason (Optional[CancellationReason]): Reason for the payment cancellation.
-        metadata (Optional[Dict[str, Union[str, int, float, bool]]]): Additional metadata related to the payment.
+        metadata (Dict[str, Any]): Additional metadata related to the payment.
         phone (Optional[str]): Customer's phone number associated with the payment.
         payment_method (str): Payment method used, default is 'bizum'.
         operation_id (Optional[str]): Bizum operation ID.
@@ -73,8 +71,10 @@ class Payment(BaseModel):
         store_id (Optional[str]): Store identification.
     """
 
+    model_config = ConfigDict(extra="ignore", validate_assignment=False)
+
     id: str = Field(
-        default_factory=lambda: str(Ksuid()),
+        default_factory=new_id,
         description="Unique identifier for the payment.",
     )
     object: str = Field(
@@ -88,7 +88,7 @@ class Payment(BaseModel):
     )
     order: str = Field(..., description="Order identifier.")
     created: int = Field(
-        default_factory=lambda: int(datetime.now(timezone.utc).timestamp()),
+        default_factory=lambda: int(time.time()),
         description="Timestamp of when the payment was created, measured in seconds since Unix epoch.",
     )
     authorization: Optional[str] = Field(
@@ -102,7 +102,7 @@ class Payment(BaseModel):
     cancellation_reason: Optional[CancellationReason] = Field(
         None, description="Reason for the payment cancellation."
     )
-    metadata: Optional[Dict[str, Union[str, int, float, bool]]] = Field(
+    metadata: Dict[str, Any] = Field(
         default_factory=dict, description="Additional metadata related to the payment."
     )
     phone: Optional[str] = Field(
@@ -117,17 +117,72 @@ class Payment(BaseModel):
     )
     store_id: Optional[str] = Field(default=None, description="Store identification")
 
-    def cancel(self, reason: CancellationReason) -> None:
+    @field_validator("object", "currency", "payment_method", mode="after")
+    @classmethod
+    def intern_code(cls, v: str) -> str:
+        """
+        Intern code fields so payments with the same value share one string.
+
+        Args:
+            v (str): The value to intern.
+
+        Returns:
+            str: The interned value.
+        """
+        return sys.intern(v)
+
+    @classmethod
+    def from_json(cls, data: Union[str, bytes]) -> "Payment":
+        """
+        Create a Payment from its JSON representation.
+
+        This is the preferred way to deserialize a payment: the JSON is parsed
+        and validated in a single pass, without building an intermediate dict.
+
+        Args:
+            data (Union[str, bytes]): The JSON document.
+
+        Returns:
+            Payment: The validated Payment instance.
+
+        Raises:
+            ValidationError: If the JSON is malformed or does not match the model.
+        """
+        return cls.model_validate_json(data)
+
+    def cancel(
+        self,
+        reason: CancellationReason,
+        *,
+        _canceled: PaymentStatus = PaymentStatus.CANCELED,
+        _now: Callable[[], float] = time.time,
+    ) -> None:
         """
         Cancel the payment and provide a reason for cancellation.
 
+        The keyword-only ``_canceled`` and ``_now`` defaults bind the target
+        status and clock once, at definition time, so bulk cancellations avoid
+        the global and attribute lookups. Callers should not pass them.
+
         Args:
             reason (CancellationReason): The reason why the payment was canceled.
         """
-        self.status = PaymentStatus.CANCELED
-        self.canceled_at = int(datetime.now(timezone.utc).timestamp())
+        self.status = _canceled
+        self.canceled_at = int(_now())
         self.cancellation_reason = reason
 
+    def transition(self, status: PaymentStatus) -> None:
+        """
+        Move the payment to the given status.
+
+        Prefer this over the named helpers when the target status is computed,
+        e.g. when replaying gateway notifications in bulk.
+
+        Args:
+            status (PaymentStatus): The new status of the payment.
+        """
+        self.status = status
+
     def mark_succeeded(self) -> None:
         """
         Mark the payment as successful.
@@ -146,12 +201,24 @@ class Payment(BaseModel):
         """
         self.status = PaymentStatus.PROCESSING
 
-    def update_metadata(self, key: str, value: Union[str, int, float, bool]) -> None:
+    def update_metadata(self, key: str, value: Any) -> None:
         """
         Update or add a metadata key-value pair.
 
         Args:
             key (str): The metadata key.
-            value (Union[str, int, float, bool]): The metadata value.
+            value (Any): The metadata value.
         """
         self.metadata[key] = value
+
+    def merge_metadata(self, values: Mapping[str, Any]) -> None:
+        """
+        Update or add several metadata key-value pairs at once.
+
+        Prefer this over repeated calls to ``update_metadata`` when loading
+        metadata in bulk, as it performs a single dict update.
+
+        Args:
+            values (Mapping[str, Any]): The metadata key-value pairs.
+        """
+        self.metadata.update(values)
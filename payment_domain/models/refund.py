@@ -1,12 +1,14 @@
-from datetime import datetime, timezone
-from enum import Enum
-from typing import Dict, Optional, Union
+import sys
+import time
+from enum import StrEnum
+from typing import Any, Dict, Optional, Union
 
-from ksuid import Ksuid
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+from ._ids import new_id
 
-class RefundStatus(Enum):
+
+class RefundStatus(StrEnum):
     """
     Enum representing the different statuses a refund can have.
     """
@@ -32,21 +34,18 @@ class RefundStatus(Enum):
             ValueError: If the name does not match any valid refund status.
         """
         try:
-            return cls[name.upper()]  # Ensure case insensitivity
+            return REFUND_STATUS_BY_NAME[name.lower()]  # Case insensitive
         except KeyError:
             raise ValueError(f"Invalid payment status name: {name}")
 
-    def __str__(self):
-        """
-        Return the string representation of the RefundStatus enum.
 
-        Returns:
-            str: The value of the enum.
-        """
-        return str(self.value)
+# Lowercase member name -> member, for direct lookups by pre-lowered names.
+REFUND_STATUS_BY_NAME: Dict[str, RefundStatus] = {
+    member.name.lower(): member for member in RefundStatus
+}
 
 
-class CancellationReason(Enum):
+class CancellationReason(StrEnum):
     """
     Enum representing the different reasons for transaction cancellations.
     """
@@ -73,18 +72,15 @@ class CancellationReason(Enum):
             ValueError: If the name does not match any valid cancellation reason.
         """
         try:
-            return cls[name.upper()]  # Ensure case insensitivity
+            return CANCELLATION_REASON_BY_NAME[name.lower()]  # Case insensitive
         except KeyError:
             raise ValueError(f"Invalid cancellation reason name: {name}")
 
-    def __str__(self):
-        """
-        Return the string representation of the CancellationReason enum.
 
-        Returns:
-            str: The value of the enum.
-        """
-        return str(self.value)
+# Lowercase member name -> member, for direct lookups by pre-lowered names.
+CANCELLATION_REASON_BY_NAME: Dict[str, CancellationReason] = {
+    member.name.lower(): member for member in CancellationReason
+}
 
 
 class Refund(BaseModel):
@@ -102,13 +98,15 @@ class Refund(BaseModel):
         authorization (Optional[str]): Authorization identifier if available.
         status (RefundStatus): Status of the refund.
         cancellation_reason (Optional[CancellationReason]): Reason for refund cancellation.
-        metadata (Optional[Dict[str, Union[str, int, float, bool]]]): Additional metadata related to the refund.
+        metadata (Dict[str, Any]): Additional metadata related to the refund.
         payment_method (str): Payment method used, default is 'bizum'.
         operation_id (Optional[str]): Bizum operation ID.
     """
 
+    model_config = ConfigDict(extra="ignore", validate_assignment=False)
+
     id: str = Field(
-        default_factory=lambda: str(Ksuid()),
+        default_factory=new_id,
         description="Unique identifier for the refund.",
     )
     object: str = Field(
@@ -122,7 +120,7 @@ class Refund(BaseModel):
     )
     order: str = Field(..., description="Order identifier.")
     created: int = Field(
-        default_factory=lambda: int(datetime.now(timezone.utc).timestamp()),
+        default_factory=lambda: int(time.time()),
         description="Timestamp of when the refund was created, measured in seconds since Unix epoch.",
     )
     payment_id: Optional[str] = Field(None, description="Original payment id")
@@ -133,7 +131,7 @@ class Refund(BaseModel):
     cancellation_reason: Optional[CancellationReason] = Field(
         None, description="Reason for the payment cancellation."
     )
-    metadata: Optional[Dict[str, Union[str, int, float, bool]]] = Field(
+    metadata: Dict[str, Any] = Field(
         default_factory=dict, description="Additional metadata related to the refund."
     )
     # phone: Optional[str] = Field(None, description="Customer's phone number associated with the payment.")
@@ -143,6 +141,39 @@ class Refund(BaseModel):
     operation_id: Optional[str] = Field(default=None, description="Bizum operation id")
     # truncated_account: Optional[str] = Field(default=None, description="Bizum truncated account")
 
+    @field_validator("object", "currency", "payment_method", mode="after")
+    @classmethod
+    def intern_code(cls, v: str) -> str:
+        """
+        Intern code fields so refunds with the same value share one string.
+
+        Args:
+            v (str): The value to intern.
+
+        Returns:
+            str: The interned value.
+        """
+        return sys.intern(v)
+
+    @classmethod
+    def from_json(cls, data: Union[str, bytes]) -> "Refund":
+        """
+        Create a Refund from its JSON representation.
+
+        This is the preferred way to deserialize a refund: the JSON is parsed
+        and validated in a single pass, without building an intermediate dict.
+
+        Args:
+            data (Union[str, bytes]): The JSON document.
+
+        Returns:
+            Refund: The validated Refund instance.
+
+        Raises:
+            ValidationError: If the JSON is malformed or does not match the model.
+        """
+        return cls.model_validate_json(data)
+
     def cancel(self, reason: CancellationReason) -> None:
         """
         Cancel the refund and provide a reason for cancellation.
@@ -151,4 +182,13 @@ class Refund(BaseModel):
             reason (CancellationReason): The reason why the refund was canceled.
         """
         self.status = RefundStatus.CANCELED
-        self.cancellation_reason = reason
\ No newline at end of file
+        self.cancellation_reason = reason
+
+    def transition(self, status: RefundStatus) -> None:
+        """
+        Move the refund to the given status.
+
+        Args:
+            status (RefundStatus): The new status of the refund.
+        """
+        self.status = status
@@ -0,0 +1,35 @@
+import time
+
+from ksuid import Ksuid
+
+from payment_domain import Payment, PaymentStatus
+from payment_domain.models._ids import new_id
+
+
+def test_new_id_is_valid_ksuid():
+    """Test that generated identifiers round-trip through Ksuid with the current timestamp."""
+    before = int(time.time())
+    value = new_id()
+    ksuid = Ksuid.from_base62(value)
+
+    assert len(value) == Ksuid.BASE62_LENGTH
+    assert str(ksuid) == value
+    assert before <= ksuid.timestamp <= int(time.time())
+
+
+def test_new_id_is_unique():
+    """Test that identifiers stay unique across pool refills."""
+    ids = {new_id() for _ in range(1000)}
+    assert len(ids) == 1000
+
+
+def test_payment_default_id():
+    """Test that a Payment created without an id gets a KSUID."""
+    payment = Payment(
+        amount=1000,
+        currency="EUR",
+        order="order_001",
+        status=PaymentStatus.CREATED
+    )
+
+    assert str(Ksuid.from_base62(payment.id)) == payment.id
@@ -1,3 +1,5 @@
+import dataclasses
+
 import pytest
 
 from payment_domain import Merchant
@@ -34,4 +36,43 @@ def test_merchant_validation():
             name="Invalid Merchant",
             fuc="123456789",
             terminal="invalid_terminal"  # Invalid terminal, should raise validation error
-        )
\ No newline at end of file
+        )
+
+
+def test_merchant_numeric_code_length():
+    """Test that the FUC and terminal length limits are enforced."""
+    with pytest.raises(ValueError):
+        Merchant(fuc="1234567890", terminal="001")  # FUC longer than 9 digits
+
+    with pytest.raises(ValueError):
+        Merchant(fuc="123456789", terminal="0001")  # Terminal longer than 3 digits
+
+    with pytest.raises(ValueError):
+        Merchant(fuc="", terminal="001")  # Empty FUC
+
+    with pytest.raises(ValueError):
+        Merchant(fuc="\u0661\u0662\u0663", terminal="001")  # Non-ASCII digits
+
+
+def test_merchant_from_json():
+    """Test that a Merchant is deserialized from JSON."""
+    merchant = Merchant.from_json('{"fuc": "123456789", "terminal": "001"}')
+
+    assert merchant.fuc == "123456789"
+    assert merchant.terminal == "001"
+
+    with pytest.raises(ValueError):
+        Merchant.from_json('{"fuc": "invalid_fuc", "terminal": "001"}')
+
+
+def test_merchant_is_slotted():
+    """Test that Merchant instances use slots instead of a per-instance dict."""
+    merchant = Merchant(fuc="123456789", terminal="001")
+
+    assert not hasattr(merchant, "__dict__")
+    assert dataclasses.asdict(merchant) == {
+        "id": "",
+        "name": "",
+        "fuc": "123456789",
+        "terminal": "001",
+    }
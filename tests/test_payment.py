@@ -1,4 +1,12 @@
-from payment_domain import CancellationReason, Payment, PaymentStatus
+import pytest
+
+from payment_domain import (
+    PAYMENT_STATUS_BY_NAME,
+    CancellationReason,
+    Payment,
+    PaymentListAdapter,
+    PaymentStatus,
+)
 
 
 def test_payment_initialization():
@@ -54,6 +62,9 @@ def test_payment_status_transitions():
     payment.confirm()
     assert payment.status == PaymentStatus.PROCESSING
 
+    payment.transition(PaymentStatus.FAILED)
+    assert payment.status == PaymentStatus.FAILED
+
 
 def test_update_metadata():
     """Test that updating metadata works as expected."""
@@ -66,4 +77,99 @@ def test_update_metadata():
     )
 
     payment.update_metadata('customer_id', 'cust_123')
-    assert payment.metadata['customer_id'] == 'cust_123'
\ No newline at end of file
+    assert payment.metadata['customer_id'] == 'cust_123'
+
+
+def test_payment_status_from_name():
+    """Test that payment statuses are resolved by name regardless of case."""
+    assert PaymentStatus.from_name("created") == PaymentStatus.CREATED
+    assert PaymentStatus.from_name("REQUIRES_ACTION") == PaymentStatus.REQUIRES_ACTION
+    assert PAYMENT_STATUS_BY_NAME["processing"] is PaymentStatus.PROCESSING
+
+    with pytest.raises(ValueError):
+        PaymentStatus.from_name("unknown")
+
+
+def test_payment_status_str():
+    """Test that payment statuses render as their value."""
+    assert str(PaymentStatus.CREATED) == "created"
+    assert f"{PaymentStatus.CANCELED}" == "canceled"
+
+
+def test_payment_list_adapter():
+    """Test that a batch of payments is validated in a single call."""
+    rows = [
+        {"amount": 1000, "currency": "EUR", "order": "order_001", "status": "created"},
+        {"amount": 2000, "currency": "EUR", "order": "order_002", "status": "failed"},
+    ]
+
+    payments = PaymentListAdapter.validate_python(rows)
+    assert [payment.order for payment in payments] == ["order_001", "order_002"]
+    assert payments[1].status == PaymentStatus.FAILED
+
+    payments = PaymentListAdapter.validate_json(PaymentListAdapter.dump_json(payments))
+    assert [payment.amount for payment in payments] == [1000, 2000]
+
+
+def test_payment_from_json():
+    """Test that a Payment round-trips through JSON."""
+    payment = Payment(
+        id="payment_12345",
+        amount=1000,
+        currency="EUR",
+        order="order_001",
+        status=PaymentStatus.CREATED
+    )
+
+    assert Payment.from_json(payment.model_dump_json()) == payment
+    assert Payment.from_json(payment.model_dump_json().encode()) == payment
+
+
+def test_metadata_defaults_to_empty_dict():
+    """Test that each payment gets its own metadata dict."""
+    first = Payment(amount=1000, currency="EUR", order="order_001", status="created")
+    second = Payment(amount=1000, currency="EUR", order="order_002", status="created")
+
+    first.update_metadata("customer_id", "cust_123")
+    assert second.metadata == {}
+
+
+def test_merge_metadata():
+    """Test that several metadata entries are merged at once."""
+    payment = Payment(amount=1000, currency="EUR", order="order_001", status="created")
+
+    payment.update_metadata("customer_id", "cust_123")
+    payment.merge_metadata({"card_brand": "visa", "customer_id": "cust_456"})
+    assert payment.metadata == {"card_brand": "visa", "customer_id": "cust_456"}
+
+
+def test_payment_status_as_key():
+    """Test that payment statuses and their values are interchangeable as keys."""
+    routes = {PaymentStatus.SUCCEEDED: "capture", PaymentStatus.FAILED: "retry"}
+
+    assert routes["succeeded"] == "capture"
+    assert PaymentStatus.FAILED in {"failed"}
+    assert hash(PaymentStatus.CREATED) == hash("created")
+
+
+def test_payment_codes_are_interned():
+    """Test that code fields of different payments share the same string."""
+    currencies = ["".join(["E", "UR"]), "".join(["EU", "R"])]
+    first, second = (
+        Payment(amount=1000, currency=currency, order="order_001", status="created")
+        for currency in currencies
+    )
+
+    assert first.currency is second.currency
+
+
+def test_payment_status_is_enum_member():
+    """Test that statuses are enum members whether validated or assigned."""
+    payment = Payment.from_json(
+        '{"amount": 1000, "currency": "EUR", "order": "order_001", "status": "created"}'
+    )
+    assert payment.status is PaymentStatus.CREATED
+
+    payment.cancel(reason=CancellationReason.DUPLICATE)
+    assert payment.status is PaymentStatus.CANCELED
+    assert payment.model_dump()["status"] is PaymentStatus.CANCELED
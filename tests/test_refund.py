@@ -1,4 +1,13 @@
-from payment_domain import CancellationReason, Refund, RefundStatus
+import pytest
+
+from payment_domain import (
+    CANCELLATION_REASON_BY_NAME,
+    REFUND_STATUS_BY_NAME,
+    CancellationReason,
+    Refund,
+    RefundListAdapter,
+    RefundStatus,
+)
 
 
 def test_refund_initialization():
@@ -34,6 +43,9 @@ def test_refund_status_transitions():
     refund.status = RefundStatus.CANCELED
     assert refund.status == RefundStatus.CANCELED
 
+    refund.transition(RefundStatus.PROCESSING)
+    assert refund.status == RefundStatus.PROCESSING
+
 
 def test_cancellation_reason():
     """Test assigning a cancellation reason to a refund."""
@@ -48,4 +60,54 @@ def test_cancellation_reason():
 
     refund.cancel(reason=CancellationReason.REQUESTED_BY_CUSTOMER)
     assert refund.status == RefundStatus.CANCELED
-    assert refund.cancellation_reason == CancellationReason.REQUESTED_BY_CUSTOMER
\ No newline at end of file
+    assert refund.cancellation_reason == CancellationReason.REQUESTED_BY_CUSTOMER
+
+
+def test_refund_enums_from_name():
+    """Test that refund statuses and cancellation reasons are resolved by name."""
+    assert RefundStatus.from_name("Succeeded") == RefundStatus.SUCCEEDED
+    assert REFUND_STATUS_BY_NAME["failed"] is RefundStatus.FAILED
+    assert CANCELLATION_REASON_BY_NAME["fraudulent"] is CancellationReason.FRAUDULENT
+    assert (
+        CancellationReason.from_name("requested_by_customer")
+        == CancellationReason.REQUESTED_BY_CUSTOMER
+    )
+
+    with pytest.raises(ValueError):
+        RefundStatus.from_name("unknown")
+
+    with pytest.raises(ValueError):
+        CancellationReason.from_name("requested")  # Value, not name
+
+
+def test_refund_list_adapter():
+    """Test that a batch of refunds is validated in a single call."""
+    rows = [
+        {"amount": 500, "currency": "EUR", "order": "order_001", "status": "created"},
+        {"amount": 700, "currency": "EUR", "order": "order_002", "status": "succeeded"},
+    ]
+
+    refunds = RefundListAdapter.validate_python(rows)
+    assert [refund.status for refund in refunds] == [
+        RefundStatus.CREATED,
+        RefundStatus.SUCCEEDED,
+    ]
+
+
+def test_refund_from_json():
+    """Test that a Refund round-trips through JSON."""
+    refund = Refund(
+        id="refund_12345",
+        amount=500,
+        currency="EUR",
+        order="order_001",
+        status=RefundStatus.CREATED
+    )
+
+    assert Refund.from_json(refund.model_dump_json()) == refund
+
+
+def test_refund_enums_str():
+    """Test that refund statuses and cancellation reasons render as their value."""
+    assert str(RefundStatus.SUCCEEDED) == "succeeded"
+    assert f"{CancellationReason.REQUESTED_BY_CUSTOMER}" == "requested"